@@ -1,5 +1,32 @@
 """Module for package and distribution."""
-from setuptools import setup
+import os
+
+from setuptools import Extension, setup
 
 exec(open("src/ga4gh/vrsatile/pydantic/version.py").read())
-setup(version=__version__)  # noqa: F821
+
+ext_modules = None
+if os.environ.get("PYDANTIC_VRSATILE_COMPILE") == "1":
+    # Optionally compile the model modules with Cython (pure-python mode). The
+    # .py sources are left untouched and remain the reference implementation.
+    # `binding` keeps compiled validators introspectable, which pydantic needs to
+    # inspect their signatures.
+    from Cython.Build import cythonize
+
+    # Modules are named explicitly, since `ga4gh` and `ga4gh.vrsatile` are
+    # namespace packages that Cython cannot derive the full module name from
+    ext_modules = cythonize(
+        [
+            Extension(f"ga4gh.vrsatile.pydantic.{module}",
+                      [f"src/ga4gh/vrsatile/pydantic/{module}.py"])
+            for module in ("vrs_models", "vrsatile_models")
+        ],
+        language_level=3,
+        compiler_directives={
+            "binding": True,
+            "boundscheck": False,
+            "wraparound": False
+        }
+    )
+
+setup(version=__version__, ext_modules=ext_modules)  # noqa: F821
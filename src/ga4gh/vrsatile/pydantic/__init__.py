@@ -1,18 +1,57 @@
 """Initialize GA4GH VRSATILE Pydantic."""
 import logging
 from abc import ABC
+from copy import deepcopy
+from enum import Enum
+from inspect import isclass
+from typing import Any, ClassVar, Dict, Literal, Tuple, Type, TypeVar, Union, \
+    get_args, get_origin
 
-from pydantic import BaseModel, model_validator, ConfigDict
+from pydantic import BaseModel, RootModel, model_validator, ConfigDict
+from pydantic.json_schema import DEFAULT_REF_TEMPLATE, GenerateJsonSchema, \
+    JsonSchemaMode
 
 
 logger = logging.getLogger("vrsatile-pydantic")
 
+Model = TypeVar("Model", bound=BaseModel)
 
-class BaseModelForbidExtra(BaseModel, ABC, extra="forbid"):
-    """Base Pydantic model class with extra values forbidden."""
+_SCHEMA_CACHE: Dict[Tuple, Dict[str, Any]] = {}
+
+
+class BaseModelCachedSchema(BaseModel, ABC):
+    """Base Pydantic model class that generates each JSON schema only once."""
+
+    @classmethod
+    def model_json_schema(
+        cls,
+        by_alias: bool = True,
+        ref_template: str = DEFAULT_REF_TEMPLATE,
+        schema_generator: Type[GenerateJsonSchema] = GenerateJsonSchema,
+        mode: JsonSchemaMode = "validation"
+    ) -> Dict[str, Any]:
+        """Return the JSON schema for the model, generating it on the first call
+        only. A copy is returned so callers may safely modify it.
+        """
+        key = (cls, by_alias, ref_template, schema_generator, mode)
+        if key not in _SCHEMA_CACHE:
+            _SCHEMA_CACHE[key] = super().model_json_schema(
+                by_alias=by_alias, ref_template=ref_template,
+                schema_generator=schema_generator, mode=mode
+            )
+        return deepcopy(_SCHEMA_CACHE[key])
+
+
+class BaseModelForbidExtra(BaseModelCachedSchema):
+    """Base Pydantic model class with extra values forbidden.
+
+    Validators are built on first use rather than at import time.
+    """
 
     model_config = ConfigDict(
-        populate_by_name=True
+        extra="forbid",
+        populate_by_name=True,
+        defer_build=True
     )
 
 
@@ -30,9 +69,30 @@ class BaseModelDeprecated(BaseModel, ABC):
         return values
 
 
+class BaseModelRequireOneOf(BaseModel, ABC):
+    """Base Pydantic model class that requires a value for at least one of the two
+    fields named in `_require_one_of`.
+    """
+
+    _require_one_of: ClassVar[Tuple[str, str]]
+
+    @model_validator(mode="after")
+    def check_one_of_present(cls, values):
+        """Check that at least one of the `_require_one_of` fields is set."""
+        field, field_id = cls._require_one_of
+        assert getattr(values, field) or getattr(values, field_id), \
+            f"Must give values for either `{field}`, `{field_id}`, or both"
+        return values
+
+
 def return_value(cls, v):
     """Return value from object.
 
+    `RootModel` values, including those in a list, are unwrapped to their root.
+    This is no longer used as a validator by the models in this package, since
+    pydantic v2 already returns the validated field value. It is kept for
+    existing callers.
+
     :param ModelMetaclass cls: Pydantic Model ModelMetaclass
     :param v: Model from vrs or vrsatile
     :return: Value
@@ -54,3 +114,69 @@ def return_value(cls, v):
         except AttributeError:
             pass
     return v
+
+
+def fast_load(cls: Type[Model], data: Any) -> Model:
+    """Build a model from trusted data without validating it.
+
+    Nested models are built with `model_construct` as well. Members of a union of
+    models are chosen by matching the `type` value in the data, or the first model
+    in the union if the data has no `type`. This should only be used for data that
+    is known to be valid, e.g. data previously dumped from these models.
+
+    :param cls: Pydantic model to build
+    :param data: Model data, keyed by field name or alias. For a `RootModel`, the
+        data for its root.
+    :return: Model instance
+    """
+    if issubclass(cls, RootModel):
+        root = _fast_load_value(cls.model_fields["root"].annotation, data)
+        return cls.model_construct(root=root)
+
+    values = dict(data)
+    for name, field in cls.model_fields.items():
+        key = field.alias if field.alias in data else name
+        if key in data:
+            values[key] = _fast_load_value(field.annotation, data[key])
+    return cls.model_construct(**values)
+
+
+def _fast_load_value(annotation: Any, value: Any) -> Any:
+    """Build value for a field annotation without validating it.
+
+    :param annotation: Field annotation
+    :param value: Field data
+    :return: Field value
+    """
+    if value is None:
+        return value
+
+    origin = get_origin(annotation)
+    if origin is Union:
+        args = [a for a in get_args(annotation) if a is not type(None)]
+        if len(args) == 1:
+            return _fast_load_value(args[0], value)
+        if isinstance(value, dict):
+            models = [a for a in args if isclass(a) and issubclass(a, BaseModel)]
+            for arg in models:
+                type_field = arg.model_fields.get("type")
+                if not type_field or type_field.default == value.get("type"):
+                    return fast_load(arg, value)
+            if models and "type" not in value:
+                return fast_load(models[0], value)
+        return value
+    elif origin is Literal:
+        # Use the literal itself, e.g. the enum member for `Literal[VRSTypes.X]`
+        return next((arg for arg in get_args(annotation) if arg == value), value)
+    elif origin is list:
+        item_annotation = get_args(annotation)[0]
+        return [_fast_load_value(item_annotation, item) for item in value]
+    elif isclass(annotation):
+        if issubclass(annotation, RootModel):
+            if not isinstance(value, annotation):
+                return fast_load(annotation, value)
+        elif issubclass(annotation, BaseModel) and isinstance(value, dict):
+            return fast_load(annotation, value)
+        elif issubclass(annotation, Enum):
+            return annotation(value)
+    return value
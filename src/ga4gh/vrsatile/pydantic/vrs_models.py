@@ -9,8 +9,7 @@ import pydantic_core
 from pydantic import Field, constr, StrictInt, StrictStr, StrictBool, \
     field_validator, StrictFloat, model_validator, RootModel, ValidationError
 
-from ga4gh.vrsatile.pydantic import return_value, BaseModelForbidExtra, \
-    BaseModelDeprecated
+from ga4gh.vrsatile.pydantic import BaseModelForbidExtra, BaseModelDeprecated
 
 
 def ensure_unique_items(items: List):
@@ -18,8 +17,18 @@ def ensure_unique_items(items: List):
     if not items:
         return items
 
-    for i, value in enumerate(items, start=1):
-        if value in items[i:]:
+    seen = set()
+    seen_unhashable = []
+    for value in items:
+        try:
+            is_duplicate = value in seen
+            seen.add(value)
+        except TypeError:
+            # Models are unhashable, so fall back to comparing by equality
+            is_duplicate = value in seen_unhashable
+            seen_unhashable.append(value)
+
+        if is_duplicate:
             raise ValidationError.from_exception_data(
                 "unique_items",
                 [
@@ -93,6 +102,8 @@ HUMAN_CYTOBAND = constr(pattern=r"^cen|[pq](ter|([1-9][0-9]*(\.[1-9][0-9]*)?))$"
 RESIDUE = constr(pattern=r"[A-Z*\-]")
 SEQUENCE = constr(pattern=r"^[A-Z*\-]*$")
 
+HUMAN_CHR_PATTERN = re.compile(r"^(X|Y|([1-9]|1[0-9]|2[0-2]))$")
+
 # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 # Numerics, Comparators, and Ranges
 
@@ -201,18 +212,15 @@ class CytobandInterval(BaseModelForbidExtra):
         ...,
         description=("The start cytoband region. MUST specify a region nearer the "
                      "terminal end (telomere) of the chromosome p-arm than `end`."),
-        example="q22.2"
+        examples=["q22.2"]
     )
     end: HUMAN_CYTOBAND = Field(
         ...,
         description=("The end cytoband region. MUST specify a region nearer the "
                      "terminal end (telomere) of the chromosome q-arm than `start`."),
-        example="q22.3"
+        examples=["q22.3"]
     )
 
-    _get_start_val = field_validator("start")(return_value)
-    _get_end_val = field_validator("end")(return_value)
-
 
 # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 # DEPRECATED Intervals
@@ -224,8 +232,8 @@ class SimpleInterval(BaseModelForbidExtra, BaseModelDeprecated):
     """
 
     type: Literal[VRSTypes.SIMPLE_INTERVAL] = VRSTypes.SIMPLE_INTERVAL
-    start: StrictInt = Field(..., description="The start coordinate", example=11)
-    end: StrictInt = Field(..., description="The end coordinate", example=22)
+    start: StrictInt = Field(..., description="The start coordinate", examples=[11])
+    end: StrictInt = Field(..., description="The end coordinate", examples=[22])
 
     _replace_with = "SequenceInterval"
 
@@ -258,14 +266,11 @@ class ChromosomeLocation(BaseModelForbidExtra):
         ..., description='The chromosome region defined by a CytobandInterval'
     )
 
-    _get_id_val = field_validator("id")(return_value)
-    _get_species_id_val = field_validator("species_id")(return_value)
-
     @field_validator("chr")
     def check_chr_value(cls, v):
         """Check chr value"""
         msg = "`chr` must be 1..22, X, or Y (case-sensitive)"
-        assert re.match(r"^(X|Y|([1-9]|1[0-9]|2[0-2]))$", v), msg
+        assert HUMAN_CHR_PATTERN.match(v), msg
         return v
 
 
@@ -287,9 +292,6 @@ class SequenceLocation(BaseModelForbidExtra):
         description="Reference sequence region defined by a SequenceInterval."
     )
 
-    _get_id_val = field_validator("id")(return_value)
-    _get_sequence_id_val = field_validator('sequence_id')(return_value)
-
 
 class Location(RootModel):
     """A contiguous segment of a biological sequence."""
@@ -311,8 +313,6 @@ class LiteralSequenceExpression(BaseModelForbidExtra):
         VRSTypes.LITERAL_SEQUENCE_EXPRESSION
     sequence: SEQUENCE = Field(..., description="the literal Sequence expressed")
 
-    _get_sequence_val = field_validator("sequence")(return_value)
-
 
 class DerivedSequenceExpression(BaseModelForbidExtra):
     """An approximate expression of a sequence that is derived from a referenced
@@ -419,12 +419,12 @@ class SequenceState(BaseModelForbidExtra, BaseModelDeprecated):
     """
 
     type: Literal[VRSTypes.SEQUENCE_STATE] = VRSTypes.SEQUENCE_STATE
-    sequence: SEQUENCE = Field(..., description="A string of RESIDUEs", example="C")
+    sequence: SEQUENCE = Field(
+        ..., description="A string of RESIDUEs", examples=["C"]
+    )
 
     _replace_with = "LiteralSequenceExpression"
 
-    _get_sequence_val = field_validator("sequence")(return_value)
-
 # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 # Feature
 
@@ -438,8 +438,6 @@ class Gene(BaseModelForbidExtra):
     type: Literal[VRSTypes.GENE] = VRSTypes.GENE
     gene_id: CURIE = Field(..., description="A CURIE reference to a Gene concept")
 
-    _get_gene_id_val = field_validator("gene_id")(return_value)
-
 
 class Feature(RootModel):
     """A named entity that can be mapped to a Location. Genes, protein domains, exons, and chromosomes are some examples of common biological entities that may be Features."""  # noqa: E501
@@ -477,9 +475,6 @@ class Allele(BaseModelForbidExtra):
         SequenceState,
     ] = Field(..., description="An expression of the sequence state")
 
-    _get_id_val = field_validator("id")(return_value)
-    _get_loc_val = field_validator("location")(return_value)
-
 
 class Haplotype(BaseModelForbidExtra):
     """A set of non-overlapping Allele members that co-occur on the same molecule."""
@@ -496,9 +491,6 @@ class Haplotype(BaseModelForbidExtra):
                      "Haplotype.")
     )
 
-    _get_id_val = field_validator("id")(return_value)
-    _get_members_val = field_validator("members")(return_value)
-
     @field_validator("members")
     def ensure_unique_items(cls, members):
         """Ensure members are unique"""
@@ -562,9 +554,6 @@ class CopyNumberChange(BaseModelForbidExtra):
                      "'efo:0030072' (high-level gain).")
     )
 
-    _get_id_val = field_validator("id")(return_value)
-    _get_subject_val = field_validator("subject")(return_value)
-
 
 class CopyNumberCount(BaseModelForbidExtra):
     """The absolute count of discrete copies of a Location or Feature, within a system
@@ -586,9 +575,6 @@ class CopyNumberCount(BaseModelForbidExtra):
         description="The integral number of copies of the subject in a system"
     )
 
-    _get_id_val = field_validator("id")(return_value)
-    _get_subject_val = field_validator("subject")(return_value)
-
 
 class GenotypeMember(BaseModelForbidExtra):
     """A class for expressing the count of a specific MolecularVariation present
@@ -631,8 +617,6 @@ class Genotype(BaseModelForbidExtra):
                      "are not  explicitly described.")
     )
 
-    _get_id_val = field_validator("id")(return_value)
-
     @field_validator("members")
     def ensure_unique_items(cls, members):
         """Ensure members are unique"""
@@ -671,8 +655,6 @@ class Text(BaseModelForbidExtra):
                      "other subclasses of Variation.")
     )
 
-    _get_id_val = field_validator("id")(return_value)
-
 
 class VariationSet(BaseModelForbidExtra):
     """An unconstrained set of Variation members."""
@@ -700,9 +682,6 @@ class VariationSet(BaseModelForbidExtra):
                      "required, but MAY be empty.")
     )
 
-    _get_id_val = field_validator("id")(return_value)
-    _get_members_val = field_validator("members")(return_value)
-
     @field_validator("members")
     def ensure_unique_items(cls, members):
         """Ensure members are unique"""
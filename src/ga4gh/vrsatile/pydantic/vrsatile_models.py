@@ -1,12 +1,14 @@
 """Define Pydantic Class models for VRSATILE models."""
 from __future__ import annotations
 from enum import Enum
-from typing import List, Optional, Union, Any, Literal
+from functools import lru_cache
+from typing import Dict, List, Optional, Type, Union, Any, Literal
 
-from pydantic import BaseModel, StrictInt, StrictStr, \
-    model_validator, field_validator, Field
+from pydantic import BaseModel, ConfigDict, StrictInt, StrictStr, TypeAdapter, \
+    field_validator, model_validator, Field
 
-from ga4gh.vrsatile.pydantic import return_value, BaseModelForbidExtra
+from ga4gh.vrsatile.pydantic import BaseModelCachedSchema, BaseModelForbidExtra, \
+    BaseModelRequireOneOf
 from ga4gh.vrsatile.pydantic.vrs_models import CURIE, Allele, CopyNumberChange, \
     CopyNumberCount, Haplotype, Text, VariationSet, SequenceLocation, \
     ChromosomeLocation, SEQUENCE, Gene
@@ -44,6 +46,8 @@ class Extension(BaseModelForbidExtra):
     for pre-negotiated exchange of message attributes when needed.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     type: Literal[VRSATILETypes.EXTENSION] = VRSATILETypes.EXTENSION
     name: StrictStr
     value: Any
@@ -69,13 +73,20 @@ class Expression(BaseModelForbidExtra):
     molecular variation include the HGVS and ISCN nomenclatures.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     type: Literal[VRSATILETypes.EXPRESSION] = VRSATILETypes.EXPRESSION
     syntax: ExpressionSyntax
     value: StrictStr
     syntax_version: Optional[StrictStr] = None
 
 
-class ValueObjectDescriptor(BaseModel, extra="allow"):
+# Map of `type` value to descriptor class, for dispatching on the `type` of
+# descriptor data
+DESCRIPTOR_BY_TYPE: Dict[str, Type[ValueObjectDescriptor]] = {}
+
+
+class ValueObjectDescriptor(BaseModelCachedSchema, extra="allow"):
     """The root class of all VODs is the abstract Value Object Descriptor
     class. All attributes of this parent class are inherited by child classes.
     """
@@ -88,11 +99,17 @@ class ValueObjectDescriptor(BaseModel, extra="allow"):
     alternate_labels: Optional[List[StrictStr]] = None
     extensions: Optional[List[Extension]] = None
 
-    _get_id_val = field_validator('id')(return_value)
-    _get_xrefs_val = field_validator('xrefs')(return_value)
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs):
+        """Register descriptor class in `DESCRIPTOR_BY_TYPE` by its `type` value."""
+        super().__pydantic_init_subclass__(**kwargs)
+        default_type = cls.model_fields["type"].default
+        if isinstance(default_type, VODClassName):
+            DESCRIPTOR_BY_TYPE[default_type.value] = cls
 
 
-class SequenceDescriptor(BaseModelForbidExtra, ValueObjectDescriptor):
+class SequenceDescriptor(BaseModelRequireOneOf, ValueObjectDescriptor,
+                         BaseModelForbidExtra):
     """This descriptor is intended to reference VRS Sequence value objects."""
 
     type: Literal[VODClassName.SEQUENCE_DESCRIPTOR] = \
@@ -101,22 +118,11 @@ class SequenceDescriptor(BaseModelForbidExtra, ValueObjectDescriptor):
     sequence: Optional[SEQUENCE] = None
     residue_type: Optional[CURIE] = None
 
-    @model_validator(mode="after")
-    def check_sequence_or_sequence_id_present(cls, values):
-        """Check that at least one of {`sequence`, `sequence_id`} is set."""
-        msg = 'Must give values for either `sequence`, `sequence_id`, or both'
-        value, value_id = values.sequence, values.sequence_id
-        assert value or value_id, msg
-        return values
+    _require_one_of = ("sequence", "sequence_id")
 
-    _get_sequence_id_val = \
-        field_validator('sequence_id')(return_value)
-    _get_sequence_val = field_validator('sequence')(return_value)
-    _get_residue_type_val = \
-        field_validator('residue_type')(return_value)
 
-
-class LocationDescriptor(BaseModelForbidExtra, ValueObjectDescriptor):
+class LocationDescriptor(BaseModelRequireOneOf, ValueObjectDescriptor,
+                         BaseModelForbidExtra):
     """This descriptor is intended to reference VRS Location value objects."""
 
     type: Literal[VODClassName.LOCATION_DESCRIPTOR] = \
@@ -124,34 +130,18 @@ class LocationDescriptor(BaseModelForbidExtra, ValueObjectDescriptor):
     location_id: Optional[CURIE] = None
     location: Optional[Union[SequenceLocation, ChromosomeLocation]] = None
 
-    @model_validator(mode="after")
-    def check_location_or_location_id_present(cls, values):
-        """Check that at least one of {`location`, `location_id`} is set."""
-        msg = 'Must give values for either `location`, `location_id`, or both'
-        value, value_id = values.location, values.location_id
-        assert value or value_id, msg
-        return values
-
-    _get_location_id_val = \
-        field_validator('location_id')(return_value)
+    _require_one_of = ("location", "location_id")
 
 
-class GeneDescriptor(BaseModelForbidExtra, ValueObjectDescriptor):
+class GeneDescriptor(BaseModelRequireOneOf, ValueObjectDescriptor,
+                     BaseModelForbidExtra):
     """This descriptor is intended to reference VRS Gene value objects."""
 
     type: Literal[VODClassName.GENE_DESCRIPTOR] = VODClassName.GENE_DESCRIPTOR
     gene_id: Optional[CURIE] = None
     gene: Optional[Gene] = None
 
-    @model_validator(mode="after")
-    def check_gene_or_gene_id_present(cls, values):
-        """Check that at least one of {`gene`, `gene_id`} is set."""
-        msg = 'Must give values for either `gene`, `gene_id`, or both'
-        value, value_id = values.gene, values.gene_id
-        assert value or value_id, msg
-        return values
-
-    _get_gene_id_val = field_validator('gene_id')(return_value)
+    _require_one_of = ("gene", "gene_id")
 
 
 class VCFRecord(BaseModelForbidExtra):
@@ -159,6 +149,8 @@ class VCFRecord(BaseModelForbidExtra):
     from a VCF record.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     genome_assembly: StrictStr
     chrom: StrictStr
     pos: StrictInt
@@ -170,7 +162,25 @@ class VCFRecord(BaseModelForbidExtra):
     info: Optional[StrictStr] = None
 
 
-class VariationDescriptor(BaseModelForbidExtra, ValueObjectDescriptor):
+@lru_cache(maxsize=None)
+def _untagged_union_adapter(cls: Type[BaseModel], field: str) -> TypeAdapter:
+    """Return type adapter for `field` of `cls` without its `type` discriminator,
+    built on first use.
+    """
+    return TypeAdapter(cls.model_fields[field].annotation)
+
+
+def _validate_untagged(cls: Type[BaseModel], field: str, v: Any) -> Any:
+    """Validate a dict without a `type` tag against every member of the union
+    in `field`, as was done before the union was discriminated on `type`. Other
+    values are returned unchanged for the discriminated union to validate.
+    """
+    if isinstance(v, dict) and "type" not in v:
+        return _untagged_union_adapter(cls, field).validate_python(v)
+    return v
+
+
+class VariationDescriptor(ValueObjectDescriptor, BaseModelForbidExtra):
     """This descriptor is intended as an class for describing VRS Variation
     value objects.
     """
@@ -179,25 +189,20 @@ class VariationDescriptor(BaseModelForbidExtra, ValueObjectDescriptor):
         VODClassName.VARIATION_DESCRIPTOR
     variation_id: Optional[CURIE] = None
     variation: Optional[Union[Allele, Haplotype, CopyNumberChange, CopyNumberCount,
-                              Text, VariationSet]] = None
+                              Text, VariationSet]] = Field(None, discriminator="type")
     molecule_context: Optional[MoleculeContext] = None
     structural_type: Optional[CURIE] = None
     expressions: Optional[List[Expression]] = None
     vcf_record: Optional[VCFRecord] = None
-    gene_context: Optional[Union[CURIE, GeneDescriptor]] = None
+    gene_context: Optional[Union[CURIE, GeneDescriptor]] = \
+        Field(None, union_mode="left_to_right")
     vrs_ref_allele_seq: Optional[SEQUENCE] = None
     allelic_state: Optional[CURIE] = None
 
-    _get_variation_id_val = \
-        field_validator('variation_id')(return_value)
-    _get_structural_type_val = \
-        field_validator('structural_type')(return_value)
-    _get_gene_context_val = \
-        field_validator('gene_context')(return_value)
-    _get_vrs_allele_ref_seq_val = \
-        field_validator('vrs_ref_allele_seq')(return_value)
-    _get_allelic_state_val = \
-        field_validator('allelic_state')(return_value)
+    @field_validator("variation", mode="before")
+    def check_variation_type(cls, v):
+        """Validate `variation` without a `type` against every Variation type."""
+        return _validate_untagged(cls, "variation", v)
 
 
 class CategoricalVariationType(str, Enum):
@@ -217,8 +222,6 @@ class CategoricalVariation(BaseModelForbidExtra):
     type: CategoricalVariationType
     complement: bool
 
-    _get_id_val = field_validator("id")(return_value)
-
 
 class CanonicalVariation(CategoricalVariation):
     """A categorical variation domain characterized by a representative
@@ -229,7 +232,12 @@ class CanonicalVariation(CategoricalVariation):
     type: Literal[CategoricalVariationType.CANONICAL_VARIATION] = \
         CategoricalVariationType.CANONICAL_VARIATION
     variation: Optional[Union[Allele, Haplotype, CopyNumberChange, CopyNumberCount,
-                              Text, VariationSet]] = None
+                              Text, VariationSet]] = Field(None, discriminator="type")
+
+    @field_validator("variation", mode="before")
+    def check_variation_type(cls, v):
+        """Validate `variation` without a `type` against every Variation type."""
+        return _validate_untagged(cls, "variation", v)
 
 
 class ComplexVariationOperator(str, Enum):
@@ -256,19 +264,18 @@ class ComplexVariation(CategoricalVariation):
         return values
 
 
-class VariationMember(BaseModel):
+class VariationMember(BaseModelCachedSchema):
     """A compact class for representing a variation context that is a member of
     a Categorical Variation. It supports one or more Expressions of a Variation
     and optionally an associated VRS ID.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     type: Literal["VariationMember"] = "VariationMember"
     expressions: List[Expression]
     variation_id: Optional[CURIE] = None
 
-    _get_variation_id_val = \
-        field_validator("variation_id")(return_value)
-
     @model_validator(mode="after")
     def check_expressions_length(cls, values):
         """Check that `expressions` contains >=1 objects"""
@@ -286,8 +293,34 @@ class CategoricalVariationDescriptor(VariationDescriptor):
     version: Optional[StrictStr] = None
     categorical_variation_id: Optional[CURIE] = None
     categorical_variation: Optional[Union[CanonicalVariation,
-                                          ComplexVariation]] = None
+                                          ComplexVariation]] = \
+        Field(None, discriminator="type")
     members: Optional[List[VariationMember]] = None
 
-    _get_categorical_variation_id_val = \
-        field_validator("categorical_variation_id")(return_value)
+    @field_validator("categorical_variation", mode="before")
+    def check_categorical_variation_type(cls, v):
+        """Validate `categorical_variation` without a `type` against every
+        Categorical Variation type.
+        """
+        return _validate_untagged(cls, "categorical_variation", v)
+
+
+@lru_cache(maxsize=None)
+def _variation_descriptors_adapter() -> TypeAdapter:
+    """Return type adapter for a list of Variation Descriptors, built on first
+    use.
+    """
+    return TypeAdapter(List[VariationDescriptor])
+
+
+def parse_variation_descriptors(
+    json_data: Union[str, bytes]
+) -> List[VariationDescriptor]:
+    """Parse a JSON array of Variation Descriptors. The JSON is decoded and
+    validated by pydantic-core in a single pass, without first building Python
+    dicts.
+
+    :param json_data: JSON array of Variation Descriptors
+    :return: Validated Variation Descriptors
+    """
+    return _variation_descriptors_adapter().validate_json(json_data)
@@ -1,14 +1,19 @@
 """Module for testing the VRSATILE model."""
+import json
+
 import pydantic
 import pytest
 
+from ga4gh.vrsatile.pydantic import fast_load, return_value
 from ga4gh.vrsatile.pydantic.vrs_models import Number, SequenceLocation, \
-    SequenceInterval, LiteralSequenceExpression, Allele, SEQUENCE
+    SequenceInterval, LiteralSequenceExpression, Allele, SEQUENCE, Variation
 from ga4gh.vrsatile.pydantic.vrsatile_models import  \
     MoleculeContext, Extension, Expression, ValueObjectDescriptor, \
     SequenceDescriptor, LocationDescriptor, GeneDescriptor, \
     VariationDescriptor, VCFRecord, CanonicalVariation, ComplexVariation, \
-    ComplexVariationOperator, CategoricalVariationDescriptor, VariationMember
+    ComplexVariationOperator, CategoricalVariationDescriptor, VariationMember, \
+    parse_variation_descriptors, DESCRIPTOR_BY_TYPE, VODClassName, VRSATILETypes, \
+    CategoricalVariationType
 
 
 @pytest.fixture(scope="module")
@@ -82,6 +87,30 @@ def test_molecule_context():
     assert MoleculeContext.PROTEIN == "protein"
 
 
+def test_forbid_extra(sequence_descriptor, location_descriptor, gene_descriptor,
+                      braf_v600e_vd, simple_repeating_del):
+    """Test that models inherit forbidding extra fields from BaseModelForbidExtra."""
+    for model in (Extension, Expression, SequenceDescriptor, LocationDescriptor,
+                  GeneDescriptor, VCFRecord, VariationDescriptor, CanonicalVariation,
+                  ComplexVariation, CategoricalVariationDescriptor):
+        assert model.model_config["extra"] == "forbid"
+    assert ValueObjectDescriptor.model_config["extra"] == "allow"
+    assert ValueObjectDescriptor.model_json_schema()["additionalProperties"] is True
+
+    descriptors = [
+        (SequenceDescriptor, sequence_descriptor.model_dump()),
+        (LocationDescriptor, location_descriptor.model_dump()),
+        (GeneDescriptor, gene_descriptor.model_dump()),
+        (VariationDescriptor, braf_v600e_vd),
+        (CategoricalVariationDescriptor, simple_repeating_del)
+    ]
+    for model, params in descriptors:
+        assert model(**params)
+        with pytest.raises(pydantic.ValidationError):
+            model(**params, disease_id="ncit:C53")
+        assert model.model_json_schema()["additionalProperties"] is False
+
+
 def test_extension(extension):
     """Test that Extension model works correctly."""
     assert extension.name == "name"
@@ -162,7 +191,10 @@ def test_value_object_descriptor(extension, expression):
         {"id": "vod:1", "type": "SequenceDescriptor", "label": [1]},
         {"id": vod.id, "type": vod.type, "xrefs": ["xref", "xrefs"]},
         {"id": vod.id, "type": vod.type, "alternate_labels": ["xref", 1]},
-        {"id": vod.id, "type": vod.type, "extensions": [extension, expression]}
+        {"id": vod.id, "type": vod.type, "extensions": [extension, expression]},
+        {"id": pydantic.RootModel[str]("value:id"), "type": vod.type},
+        {"id": vod.id, "type": vod.type,
+         "xrefs": [pydantic.RootModel[str]("hgnc:4")]}
     ]
 
     for invalid_param in invalid_params:
@@ -170,6 +202,59 @@ def test_value_object_descriptor(extension, expression):
             ValueObjectDescriptor(**invalid_param)
 
 
+def test_descriptor_by_type(braf_v600e_vd):
+    """Test that descriptor classes are registered by their `type` value."""
+    assert DESCRIPTOR_BY_TYPE == {
+        "SequenceDescriptor": SequenceDescriptor,
+        "LocationDescriptor": LocationDescriptor,
+        "GeneDescriptor": GeneDescriptor,
+        "VariationDescriptor": VariationDescriptor,
+        "CategoricalVariationDescriptor": CategoricalVariationDescriptor
+    }
+
+    vd = DESCRIPTOR_BY_TYPE[braf_v600e_vd["type"]](**braf_v600e_vd)
+    assert isinstance(vd, VariationDescriptor)
+
+
+def test_enum_type_values(allele):
+    """Test that `type` fields accept and return their enum members."""
+    e = Extension(name="example", value="value", type=VRSATILETypes.EXTENSION)
+    assert e.type is VRSATILETypes.EXTENSION
+    assert e.model_dump()["type"] is VRSATILETypes.EXTENSION
+
+    e = Expression(syntax="hgvs.g", value="NC_000007.13:g.55259515T>G",
+                   type=VRSATILETypes.EXPRESSION)
+    assert e.type is VRSATILETypes.EXPRESSION
+
+    gd = GeneDescriptor(id="vod:id", gene_id="gene:abl1",
+                        type=VODClassName.GENE_DESCRIPTOR)
+    assert gd.type is VODClassName.GENE_DESCRIPTOR
+    assert gd.model_dump()["type"] is VODClassName.GENE_DESCRIPTOR
+
+    vd = VariationDescriptor(id="vod:id", variation_id="var:id",
+                             type=VODClassName.VARIATION_DESCRIPTOR)
+    assert vd.type is VODClassName.VARIATION_DESCRIPTOR
+    assert VariationDescriptor(id="vod:id", variation_id="var:id").type is \
+        VODClassName.VARIATION_DESCRIPTOR
+
+    cv = CanonicalVariation(variation=allele, complement=False,
+                            type=CategoricalVariationType.CANONICAL_VARIATION)
+    assert cv.type is CategoricalVariationType.CANONICAL_VARIATION
+
+    cvd = CategoricalVariationDescriptor(
+        id="vod:id", categorical_variation=cv,
+        type=VODClassName.CATEGORICAL_VARIATION_DESCRIPTOR
+    )
+    assert cvd.categorical_variation.type is \
+        CategoricalVariationType.CANONICAL_VARIATION
+    assert cvd.model_dump()["categorical_variation"]["type"] is \
+        CategoricalVariationType.CANONICAL_VARIATION
+
+    with pytest.raises(pydantic.ValidationError):
+        GeneDescriptor(id="vod:id", gene_id="gene:abl1",
+                       type=VODClassName.SEQUENCE_DESCRIPTOR)
+
+
 def test_sequence_descriptor(sequence_descriptor, gene):
     """Test that Sequence Descriptor model works correctly."""
     assert sequence_descriptor.id == "vod:id"
@@ -278,6 +363,9 @@ def test_vcf_record(vcf_record):
         with pytest.raises(pydantic.ValidationError):
             VCFRecord(**invalid_param)
 
+    with pytest.raises(pydantic.ValidationError):
+        vcf_record.pos = 1
+
 
 def test_variation_descriptor(allele, gene_descriptor, vcf_record, expression,
                               extension, braf_v600e_vd):
@@ -292,6 +380,14 @@ def test_variation_descriptor(allele, gene_descriptor, vcf_record, expression,
     assert vd.variation.location.type == "SequenceLocation"
     assert vd.variation.location.interval.type == "SequenceInterval"
 
+    # variation without a `type` is still matched against every Variation type
+    allele_dict = allele.model_dump(exclude={"type"})
+    vd = VariationDescriptor(id="var:id", variation=allele_dict)
+    assert vd.variation == allele
+    assert "type" not in allele_dict
+    vd = VariationDescriptor(id="var:id", variation={"definition": "APOE4"})
+    assert vd.variation.type == "Text"
+
     vd = VariationDescriptor(id="var:id", variation=allele,
                              type="VariationDescriptor",
                              gene_context=gene_descriptor,
@@ -327,6 +423,14 @@ def test_variation_descriptor(allele, gene_descriptor, vcf_record, expression,
     assert vd.vrs_ref_allele_seq == "C"
     assert vd.allelic_state == "GENO:00000875"
 
+    vd = VariationDescriptor(id="var:id", variation_id="variation:id",
+                             gene_context="ncbigene:673")
+    assert vd.gene_context == "ncbigene:673"
+
+    vd = VariationDescriptor(id="var:id", variation_id="variation:id",
+                             gene_context=gene_descriptor.model_dump())
+    assert vd.gene_context == gene_descriptor
+
     invalid_params = [
         {"id": "vod:id", "variation_id": "var:id", "type": "GeneDescriptor"},
         {"id": "vod:id", "variation_id": "var:id", "molecule_context": "g"},
@@ -335,8 +439,11 @@ def test_variation_descriptor(allele, gene_descriptor, vcf_record, expression,
         {"id": "vod:id", "variation_id": "var:id", "expressions": expression},
         {"id": "vod:id", "variation_id": "var:id", "vcf_record": expression},
         {"id": "vod:id", "variation_id": "var:id", "gene_context": extension},
+        {"id": "vod:id", "variation_id": "var:id",
+         "gene_context": pydantic.RootModel[str]("ncbigene:673")},
         {"id": "vod:id", "variation_id": "var:id", "vrs_ref_allele_seq": "A!"},
         {"id": "vod:id", "variation_id": "var:id", "allelic_state": "ACT"},
+        {"id": "vod:id", "variation": {"type": "Gene", "gene_id": "ncbigene:1"}},
     ]
 
     for invalid_param in invalid_params:
@@ -344,6 +451,17 @@ def test_variation_descriptor(allele, gene_descriptor, vcf_record, expression,
             VariationDescriptor(**invalid_param)
 
 
+def test_model_json_schema():
+    """Test that JSON schemas are cached and returned as copies."""
+    schema = VariationDescriptor.model_json_schema()
+    assert schema == \
+        pydantic.BaseModel.model_json_schema.__func__(VariationDescriptor)
+    schema["title"] = "Modified"
+    assert VariationDescriptor.model_json_schema()["title"] == "VariationDescriptor"
+    assert CategoricalVariationDescriptor.model_json_schema()["title"] == \
+        "CategoricalVariationDescriptor"
+
+
 def test_canonical_variation(allele):
     """Test creation and usage of canonical variations."""
     cv = CanonicalVariation(
@@ -361,6 +479,10 @@ def test_canonical_variation(allele):
     assert cv.variation.state.type.value == "LiteralSequenceExpression"
     assert cv.variation.state.sequence == "C"
 
+    cv = CanonicalVariation(complement=True,
+                            variation=allele.model_dump(exclude={"type"}))
+    assert cv.variation == allele
+
     assert set(cv.model_json_schema()["properties"].keys()) == {
         "_id", "type", "complement", "variation"
     }
@@ -499,3 +621,80 @@ def test_categorical_variation_descriptor(simple_repeating_del):
     assert expressions[1].type == "Expression"
     assert expressions[1].syntax == "hgvs.g"
     assert expressions[1].value == "NC_000013.10:g.20763488del"
+
+    # categorical_variation without a `type` is still matched against every
+    # Categorical Variation type
+    untagged = {key: value for key, value in
+                simple_repeating_del["categorical_variation"].items()
+                if key != "type"}
+    cvd_untagged = CategoricalVariationDescriptor(
+        **{**simple_repeating_del, "categorical_variation": untagged}
+    )
+    assert cvd_untagged.categorical_variation == cvd.categorical_variation
+    assert isinstance(cvd_untagged.categorical_variation, CanonicalVariation)
+    assert "type" not in untagged
+
+    invalid_param = {**simple_repeating_del}
+    invalid_param["categorical_variation"] = {
+        **simple_repeating_del["categorical_variation"], "type": "Allele"
+    }
+    with pytest.raises(pydantic.ValidationError):
+        CategoricalVariationDescriptor(**invalid_param)
+
+
+def test_return_value(allele):
+    """Test that return_value unwraps RootModel values."""
+    assert return_value(None, None) is None
+    assert return_value(None, "ncbigene:673") == "ncbigene:673"
+    assert return_value(None, allele) is allele
+    assert return_value(None, Variation(allele)) is allele
+    nested = pydantic.RootModel[Variation](Variation(allele))
+    assert return_value(None, nested) == Variation(allele)
+    assert return_value(None, [nested, "ncbigene:673", allele]) == \
+        [allele, "ncbigene:673", allele]
+
+
+def test_fast_load(simple_repeating_del, braf_v600e_vd, gene_descriptor):
+    """Test that fast_load builds the same models as validation does."""
+    cvd = fast_load(CategoricalVariationDescriptor, simple_repeating_del)
+    assert cvd == CategoricalVariationDescriptor(**simple_repeating_del)
+    assert isinstance(cvd.categorical_variation, CanonicalVariation)
+    assert isinstance(cvd.categorical_variation.variation, Allele)
+    assert cvd.categorical_variation.id == "unk:?"
+    assert isinstance(cvd.members[0].expressions[0], Expression)
+    validated = CategoricalVariationDescriptor(**simple_repeating_del)
+    allele = cvd.categorical_variation.variation
+    assert type(allele.type) is type(validated.categorical_variation.variation.type)
+    assert type(allele.state.type) is \
+        type(validated.categorical_variation.variation.state.type)
+    assert allele.state.type.value == "LiteralSequenceExpression"
+
+    params = {**braf_v600e_vd, "gene_context": gene_descriptor.model_dump()}
+    vd = fast_load(VariationDescriptor, params)
+    assert vd == VariationDescriptor(**params)
+    assert isinstance(vd.molecule_context, MoleculeContext)
+    assert isinstance(vd.gene_context, GeneDescriptor)
+    assert vd.model_fields_set == set(params)
+
+    # without a `type`, the first model in the union is used
+    params = {"id": "vod:id",
+              "gene_context": {"id": "gene:id", "gene_id": "ncbigene:1"}}
+    vd = fast_load(VariationDescriptor, params)
+    assert isinstance(vd.gene_context, GeneDescriptor)
+    assert vd == VariationDescriptor(**params)
+
+    variation = braf_v600e_vd["variation"]
+    v = fast_load(Variation, variation)
+    assert isinstance(v.root, Allele)
+    assert v == Variation(variation)
+
+
+def test_parse_variation_descriptors(braf_v600e_vd):
+    """Test that a JSON array of Variation Descriptors is parsed correctly."""
+    vds = parse_variation_descriptors(json.dumps([braf_v600e_vd, braf_v600e_vd]))
+    assert vds == [VariationDescriptor(**braf_v600e_vd)] * 2
+
+    assert parse_variation_descriptors(b"[]") == []
+
+    with pytest.raises(pydantic.ValidationError):
+        parse_variation_descriptors(json.dumps([{"id": "vod:id", "foo": "bar"}]))